@@ -0,0 +1,68 @@
+"""Array-backed, page-grouped collection of text blocks."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Dict, List
+
+import numpy as np
+
+from models import TextBlock
+
+
+@dataclass
+class TextBlockCollection:
+    """
+    Text blocks grouped by page with their bboxes stacked in NumPy arrays.
+
+    Arrays are stored in page order so each page's rows form a contiguous
+    slice; order maps those rows back to positions in blocks. bboxes is
+    column-major, so each coordinate column (bboxes[:, 0] for x0, ...) is a
+    contiguous array, which is how the geometry code reads it.
+    """
+    blocks: List[TextBlock]
+    bboxes: np.ndarray  # (N, 4) float64 (x0, y0, x1, y1), grouped by page, Fortran order
+    page_numbers: np.ndarray  # (N,) int64, sorted ascending
+    order: np.ndarray  # (N,) row -> index into blocks
+    page_slices: Dict[int, slice]  # page number -> rows of that page
+
+    @classmethod
+    def from_blocks(cls, blocks: List[TextBlock]) -> TextBlockCollection:
+        """
+        Build a collection from a list of text blocks.
+
+        Args:
+            blocks: List of TextBlock objects in any order
+
+        Returns:
+            TextBlockCollection over the given blocks
+        """
+        n = len(blocks)
+        page_numbers = np.fromiter(
+            (block.page_number for block in blocks), dtype=np.int64, count=n
+        )
+        bboxes = np.array([block.bbox for block in blocks], dtype=np.float64).reshape(n, 4)
+
+        # Stable sort keeps the original block order within each page
+        order = np.argsort(page_numbers, kind='stable')
+        page_numbers = page_numbers[order]
+        bboxes = np.asfortranarray(bboxes[order])
+
+        pages, starts = np.unique(page_numbers, return_index=True)
+        ends = np.append(starts[1:], n)
+        page_slices = {
+            page: slice(start, end)
+            for page, start, end in zip(pages.tolist(), starts.tolist(), ends.tolist())
+        }
+
+        return cls(
+            blocks=blocks,
+            bboxes=bboxes,
+            page_numbers=page_numbers,
+            order=order,
+            page_slices=page_slices
+        )
+
+    def __len__(self) -> int:
+        """Number of blocks in the collection."""
+        return len(self.blocks)
@@ -3,22 +3,36 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import logging
+import re
 from pathlib import Path
 from typing import List, Optional
 
+from models import OVERLAP_STRATEGIES, PageSelection
+
 logger = logging.getLogger(__name__)
 
+# Choices for the log level option
+LOG_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR')
+
+# One "N" or "N-M" item of a page range, followed by a comma or the end.
+# Numbers take the forms int() accepts: an optional "+" and "_" separators
+_PAGE_ITEM_PATTERN = re.compile(
+    r'\s*(\+?\d+(?:_\d+)*)\s*(?:-\s*(\+?\d+(?:_\d+)*))?\s*(?:(,)|\Z)'
+)
+
 
 class CLIHandler:
     """Handle command-line argument parsing and validation."""
 
     @staticmethod
-    def parse_page_range(page_str: str) -> List[int]:
+    def parse_page_range(page_str: str) -> PageSelection:
         """
-        Parse page range string into list of page numbers.
+        Parse page range string into a selection of page numbers.
 
-        Supports formats:
+        Ranges are kept as intervals rather than expanded, so "1-100000"
+        costs the same as "1-5". Iterating the result yields:
         - "1,3,5" -> [0, 2, 4] (0-indexed)
         - "1-5" -> [0, 1, 2, 3, 4]
         - "1,3-5,10" -> [0, 2, 3, 4, 9]
@@ -27,73 +41,83 @@ class CLIHandler:
             page_str: Comma-separated page range string (1-indexed)
 
         Returns:
-            List of page numbers (0-indexed)
+            PageSelection of page numbers (0-indexed)
 
         Raises:
             ValueError: If page range format is invalid
         """
         if not page_str:
-            return []
-
-        pages = []
-        parts = page_str.split(',')
-
-        for part in parts:
-            part = part.strip()
-            if '-' in part:
-                # Range format: "start-end"
-                try:
-                    start, end = part.split('-', 1)
-                    start = int(start.strip())
-                    end = int(end.strip())
-
-                    if start < 1 or end < 1:
-                        raise ValueError(f"Page numbers must be >= 1: {part}")
-
-                    if start > end:
-                        raise ValueError(f"Start page must be <= end page: {part}")
-
-                    # Convert to 0-indexed and add range
-                    # Example: "1-5" (1-indexed) -> [0, 1, 2, 3, 4] (0-indexed)
-                    pages.extend(range(start - 1, end))
-                except ValueError as e:
-                    if "must be" in str(e):
-                        raise
-                    raise ValueError(f"Invalid page range format: {part}") from e
-            else:
-                # Single page number
-                try:
-                    page_num = int(part)
-                    if page_num < 1:
-                        raise ValueError(f"Page numbers must be >= 1: {part}")
-                    # Convert to 0-indexed
-                    pages.append(page_num - 1)
-                except ValueError as e:
-                    if "must be" in str(e):
-                        raise
-                    raise ValueError(f"Invalid page number: {part}") from e
-
-        # Remove duplicates and sort
-        pages = sorted(set(pages))
-        return pages
+            return PageSelection()
+
+        intervals = []
+        pos = 0
+
+        # Scan the string item by item, each match ending at a comma or the end
+        while True:
+            match = _PAGE_ITEM_PATTERN.match(page_str, pos)
+            if match is None:
+                part = page_str[pos:].split(',', 1)[0].strip()
+                if '-' in part:
+                    raise ValueError(f"Invalid page range format: {part}")
+                raise ValueError(f"Invalid page number: {part}")
+
+            start_str, end_str, comma = match.groups()
+            start = int(start_str)
+            end = start if end_str is None else int(end_str)
+
+            if start < 1 or end < 1:
+                part = match.group(0).strip().rstrip(',').strip()
+                raise ValueError(f"Page numbers must be >= 1: {part}")
+
+            if start > end:
+                part = match.group(0).strip().rstrip(',').strip()
+                raise ValueError(f"Start page must be <= end page: {part}")
+
+            # Convert to a 0-indexed half-open interval
+            # Example: "1-5" (1-indexed) -> (0, 5), i.e. pages 0-4 (0-indexed)
+            intervals.append((start - 1, end))
+
+            if comma is None:
+                break
+            pos = match.end()
+
+        return PageSelection(tuple(intervals))
 
     @staticmethod
-    def parse_arguments() -> argparse.Namespace:
+    @functools.lru_cache(maxsize=None)
+    def _build_parser() -> argparse.ArgumentParser:
         """
-        Parse command-line arguments.
+        Build the command-line argument parser.
+
+        The parser is built once and reused by later calls.
 
         Returns:
-            Parsed arguments namespace
+            Configured ArgumentParser
         """
         parser = argparse.ArgumentParser(
             description="Extract text regions from PDF and visualize as bounding boxes",
             formatter_class=argparse.RawDescriptionHelpFormatter
         )
 
-        parser.add_argument(
+        # Exactly one input source; argparse reports a missing or doubled one
+        # with its usage message
+        input_group = parser.add_mutually_exclusive_group(required=True)
+
+        input_group.add_argument(
             'pdf_path',
             type=str,
-            help='Path to input PDF file'
+            nargs='?',
+            default=None,
+            help='Path to input PDF file (omit when using --pdf-dir)'
+        )
+
+        input_group.add_argument(
+            '--pdf-dir',
+            type=str,
+            default=None,
+            metavar='DIR',
+            help='Process every PDF in DIR in parallel, one worker process per PDF. '
+                 'Cannot be combined with pdf_path.'
         )
 
         parser.add_argument(
@@ -108,17 +132,23 @@ class CLIHandler:
                  'If filename is provided, uses that name.'
         )
 
+        parser.add_argument(
+            '--pretty-json',
+            action='store_true',
+            help='Write indented JSON when --save-json is used (default: compact)'
+        )
+
         parser.add_argument(
             '--filter-overlapping',
             action='store_true',
-            help='Filter overlapping bounding boxes using Shapely'
+            help='Filter overlapping bounding boxes'
         )
 
         parser.add_argument(
             '--overlap-strategy',
             type=str,
-            default='keep_largest',
-            choices=['keep_largest', 'keep_first'],
+            default=OVERLAP_STRATEGIES[0],
+            choices=OVERLAP_STRATEGIES,
             help='Strategy for filtering overlapping boxes when --filter-overlapping is used. '
                  'Options: keep_largest (default), keep_first'
         )
@@ -144,17 +174,33 @@ class CLIHandler:
             '--log-level',
             type=str,
             default='INFO',
-            choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
+            choices=LOG_LEVELS,
             help='Set logging level (default: INFO)'
         )
 
-        return parser.parse_args()
+        return parser
+
+    @staticmethod
+    def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+        """
+        Parse command-line arguments.
+
+        Args:
+            argv: Optional argument list. If None, uses sys.argv[1:].
+
+        Returns:
+            Parsed arguments namespace
+        """
+        return CLIHandler._build_parser().parse_args(argv)
 
     @staticmethod
     def validate_arguments(args: argparse.Namespace) -> bool:
         """
         Validate parsed arguments.
 
+        Sets args.pages_parsed to the PageSelection for --pages (None if
+        not given).
+
         Args:
             args: Parsed arguments namespace
 
@@ -164,21 +210,40 @@ class CLIHandler:
         Raises:
             ValueError: If arguments are invalid
         """
-        # Basic PDF path validation (detailed validation done in PDFReader)
-        pdf_path = Path(args.pdf_path)
-        if not pdf_path.exists():
-            raise ValueError(f"PDF file not found: {pdf_path}")
-
-        if not pdf_path.is_file():
-            raise ValueError(f"Path is not a file: {pdf_path}")
-
-        if pdf_path.suffix.lower() != '.pdf':
-            raise ValueError(f"File is not a PDF: {pdf_path}")
-
-        # Validate page range if provided
+        # Exactly one input source must be given
+        if (args.pdf_path is None) == (args.pdf_dir is None):
+            raise ValueError("Provide either pdf_path or --pdf-dir (but not both)")
+
+        if args.pdf_dir is not None:
+            pdf_dir = Path(args.pdf_dir)
+            if not pdf_dir.is_dir():
+                raise ValueError(f"PDF directory not found: {pdf_dir}")
+
+            # A fixed JSON name would make every PDF in the directory
+            # overwrite the same file
+            if args.save_json:
+                raise ValueError(
+                    "--save-json FILENAME cannot be used with --pdf-dir; "
+                    "use --save-json without a filename"
+                )
+        else:
+            # Basic PDF path validation (detailed validation done in PDFReader)
+            pdf_path = Path(args.pdf_path)
+            if not pdf_path.exists():
+                raise ValueError(f"PDF file not found: {pdf_path}")
+
+            if not pdf_path.is_file():
+                raise ValueError(f"Path is not a file: {pdf_path}")
+
+            if pdf_path.suffix.lower() != '.pdf':
+                raise ValueError(f"File is not a PDF: {pdf_path}")
+
+        # Validate page range if provided, keeping the result on args so
+        # it does not have to be parsed again
+        args.pages_parsed = None
         if args.pages:
             try:
-                CLIHandler.parse_page_range(args.pages)
+                args.pages_parsed = CLIHandler.parse_page_range(args.pages)
             except ValueError as e:
                 raise ValueError(f"Invalid page range: {e}") from e
 
@@ -6,26 +6,40 @@ import json
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import BinaryIO, Dict, Any, List, Optional, Tuple
 
 from exceptions import JSONExportError
 from models import TextBlock
 
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used without it
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps(obj: Any) -> bytes:
+    """Serialize obj to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 class JSONExporter:
     """Export extracted text data to JSON format."""
 
-    def __init__(self, pdf_path: Path):
+    def __init__(self, pdf_path: Path, pretty: bool = False):
         """
         Initialize JSONExporter.
 
         Args:
             pdf_path: Path to the PDF file
+            pretty: If True, write indented JSON instead of compact JSON
         """
         self.pdf_path = Path(pdf_path)
         self.pdf_name = self.pdf_path.name
+        self.pretty = pretty
 
     def _get_output_path(self, filename: Optional[str] = None) -> Path:
         """
@@ -62,20 +76,39 @@ class JSONExporter:
         output_path = self.pdf_path.parent / filename
         return output_path
 
-    def _format_data(
+    def _format_block(self, block: TextBlock) -> Dict[str, Any]:
+        """
+        Format a single text block for JSON export.
+
+        Args:
+            block: TextBlock object
+
+        Returns:
+            Dictionary formatted for JSON export
+        """
+        return {
+            "text": block.text,
+            "bbox": list(block.bbox),  # Convert tuple to list for JSON
+            "page_number": block.page_number + 1,  # Convert to 1-indexed
+            "word_count": block.word_count,
+            "pdf_width": block.pdf_width,
+            "pdf_height": block.pdf_height
+        }
+
+    def _page_summary(
         self,
         text_blocks: List[TextBlock],
         total_pages: Optional[int] = None
-    ) -> Dict[str, Any]:
+    ) -> Tuple[List[int], int]:
         """
-        Format text blocks data structure for JSON export.
+        Get the processed page list and total page count for the envelope.
 
         Args:
             text_blocks: List of TextBlock objects
             total_pages: Optional total page count. If None, estimates from processed pages.
 
         Returns:
-            Dictionary formatted for JSON export
+            Tuple of (pages_processed, total_pages), pages 1-indexed
         """
         # Get unique page numbers (convert from 0-indexed to 1-indexed for JSON)
         pages_processed = sorted(set(block.page_number + 1 for block in text_blocks))
@@ -84,27 +117,64 @@ class JSONExporter:
         if total_pages is None:
             total_pages = max(pages_processed) if pages_processed else 0
 
-        # Format text blocks
-        blocks_data = []
-        for block in text_blocks:
-            block_dict = {
-                "text": block.text,
-                "bbox": list(block.bbox),  # Convert tuple to list for JSON
-                "page_number": block.page_number + 1,  # Convert to 1-indexed
-                "word_count": block.word_count,
-                "pdf_width": block.pdf_width,
-                "pdf_height": block.pdf_height
-            }
-            blocks_data.append(block_dict)
-
-        data = {
+        return pages_processed, total_pages
+
+    def _format_data(
+        self,
+        text_blocks: List[TextBlock],
+        total_pages: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """
+        Format the full data structure for JSON export.
+
+        Args:
+            text_blocks: List of TextBlock objects
+            total_pages: Optional total page count. If None, estimates from processed pages.
+
+        Returns:
+            Dictionary formatted for JSON export
+        """
+        pages_processed, total_pages = self._page_summary(text_blocks, total_pages)
+
+        blocks_data = [self._format_block(block) for block in text_blocks]
+
+        return {
             "pdf_name": self.pdf_name,
             "total_pages": total_pages,
             "pages_processed": pages_processed,
             "text_blocks": blocks_data
         }
 
-        return data
+    def _write_json(
+        self,
+        f: BinaryIO,
+        text_blocks: List[TextBlock],
+        total_pages: Optional[int] = None
+    ) -> None:
+        """
+        Stream text blocks to an open file as a compact JSON document.
+
+        The envelope is written by hand and each block is serialized on its
+        own, so the full document is never held in memory.
+
+        Args:
+            f: Binary file opened for writing
+            text_blocks: List of TextBlock objects
+            total_pages: Optional total page count. If None, estimates from processed pages.
+        """
+        pages_processed, total_pages = self._page_summary(text_blocks, total_pages)
+
+        f.write(b'{"pdf_name":' + _dumps(self.pdf_name))
+        f.write(b',"total_pages":' + _dumps(total_pages))
+        f.write(b',"pages_processed":' + _dumps(pages_processed))
+        f.write(b',"text_blocks":[')
+
+        for i, block in enumerate(text_blocks):
+            if i:
+                f.write(b',')
+            f.write(_dumps(self._format_block(block)))
+
+        f.write(b']}')
 
     def export(
         self,
@@ -128,7 +198,6 @@ class JSONExporter:
         """
         try:
             output_path = self._get_output_path(output_filename)
-            data = self._format_data(text_blocks, total_pages=total_pages)
 
             # Check write permissions
             output_dir = output_path.parent
@@ -145,9 +214,19 @@ class JSONExporter:
                     f"JSON file {output_path} already exists, will be overwritten"
                 )
 
-            # Write JSON file with pretty formatting
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            if self.pretty:
+                # Indented output needs the whole document at once; serialize
+                # it in memory and write it with a single call
+                data = self._format_data(text_blocks, total_pages=total_pages)
+                if orjson is not None:
+                    payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+                else:
+                    payload = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+                output_path.write_bytes(payload)
+            else:
+                # Stream compact JSON through a large buffer
+                with open(output_path, 'wb', buffering=1 << 20) as f:
+                    self._write_json(f, text_blocks, total_pages=total_pages)
 
             logger.info(f"JSON exported successfully: {output_path}")
             return output_path
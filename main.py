@@ -2,16 +2,19 @@
 
 from __future__ import annotations
 
+import argparse
 import logging
+import os
 import sys
 from pathlib import Path
+from typing import Optional
 
 from cli_handler import CLIHandler
 from exceptions import PDFDecryptionError, PDFMapperException
-from json_exporter import JSONExporter
-from overlap_filter import OverlapFilter
-from pdf_annotator import PDFBBoxAnnotator
-from pdf_reader import PDFReader
+
+# Modules pulling in PyMuPDF, NumPy, numba or the process pool are imported
+# inside the processing functions when first needed, so --help and argument
+# errors return without loading them
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +22,164 @@ logger = logging.getLogger(__name__)
 OVERLAP_THRESHOLD_DEFAULT = 0.5
 
 
+def _configure_logging(log_level: str) -> None:
+    """
+    Configure logging for the current process.
+
+    Args:
+        log_level: Name of the logging level (e.g. "INFO")
+    """
+    logging.basicConfig(
+        level=getattr(logging, log_level),
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+        datefmt='%Y-%m-%d %H:%M:%S'
+    )
+
+
+def _process_one(
+    pdf_path: Path,
+    args: argparse.Namespace,
+    extract_workers: Optional[int] = None
+) -> None:
+    """
+    Run extraction, filtering, annotation and export for a single PDF.
+
+    Module-level so it can be dispatched to worker processes.
+
+    Args:
+        pdf_path: Path to the PDF file
+        args: Validated arguments namespace
+        extract_workers: Optional number of page extraction processes.
+                        If None, PDFReader's default is used.
+
+    Raises:
+        PDFMapperException: If any processing step fails
+    """
+    page_range = args.pages_parsed
+
+    # Initialize PDFReader
+    from pdf_reader import PDFReader
+    pdf_reader = PDFReader(pdf_path)
+    pdf_reader.validate_path()
+    pdf_reader.open_pdf()
+
+    try:
+        # Try to decrypt if needed
+        try:
+            # Use provided password if available
+            password = args.encryption_password if args.encryption_password else None
+            pdf_reader.decrypt_pdf(password=password)
+        except PDFDecryptionError:
+            if not args.encryption_password:
+                logger.error("Please provide --encryption-password if PDF is encrypted")
+            raise
+
+        extract_kwargs = {'page_range': page_range}
+        if extract_workers is not None:
+            extract_kwargs['num_workers'] = extract_workers
+
+        from pdf_annotator import PDFBBoxAnnotator
+        pdf_annotator = PDFBBoxAnnotator(pdf_reader.pdf_document, pdf_path)
+
+        if not args.filter_overlapping and args.save_json is None:
+            # Nothing needs the full block list, so draw each page as it is
+            # extracted
+            pdf_annotator.annotate_from_reader(pdf_reader, **extract_kwargs)
+            pdf_annotator.save_pdf()  # Saves as new file with _annotated suffix
+            return
+
+        # Extract text blocks
+        text_blocks = pdf_reader.extract_text_blocks(**extract_kwargs)
+
+        # Filter overlapping if requested
+        if args.filter_overlapping:
+            logger.info(f"Filtering overlapping bounding boxes using strategy: {args.overlap_strategy}")
+            from overlap_filter import OverlapFilter
+            overlap_filter = OverlapFilter(overlap_threshold=OVERLAP_THRESHOLD_DEFAULT)
+            text_blocks = overlap_filter.filter_overlapping(
+                text_blocks,
+                strategy=args.overlap_strategy
+            )
+            logger.info(f"After filtering: {len(text_blocks)} text blocks")
+
+        # Annotate PDF with bounding boxes
+        pdf_annotator.draw_rectangles(text_blocks)
+        pdf_annotator.save_pdf()  # Saves as new file with _annotated suffix
+
+        # Export to JSON if requested
+        if args.save_json is not None:
+            from json_exporter import JSONExporter
+            json_exporter = JSONExporter(pdf_path, pretty=args.pretty_json)
+            # If empty string (flag provided without value), use default name
+            # Otherwise use provided filename
+            output_filename = None if args.save_json == '' else args.save_json
+            # Get total pages from PDF metadata
+            pdf_metadata = pdf_reader.get_pdf_metadata()
+            total_pages = pdf_metadata['total_pages']
+            output_path = json_exporter.export(
+                text_blocks,
+                output_filename=output_filename,
+                total_pages=total_pages
+            )
+            logger.info(f"JSON exported to: {output_path}")
+
+    finally:
+        # Ensure PDF is always closed, even if errors occur
+        pdf_reader.close()
+
+
+def _process_directory(pdf_dir: Path, args: argparse.Namespace) -> None:
+    """
+    Process every PDF in a directory, one PDF per worker process.
+
+    Files produced by earlier runs (*_annotated.pdf) are skipped.
+
+    Args:
+        pdf_dir: Directory containing PDF files
+        args: Validated arguments namespace
+
+    Raises:
+        PDFMapperException: If any PDF fails to process
+    """
+    pdf_paths = sorted(
+        path for path in pdf_dir.iterdir()
+        if path.is_file()
+        and path.suffix.lower() == '.pdf'
+        and not path.stem.endswith('_annotated')
+    )
+    if not pdf_paths:
+        logger.warning(f"No PDF files found in {pdf_dir}")
+        return
+
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    max_workers = min(os.cpu_count() or 1, len(pdf_paths))
+    logger.info(f"Processing {len(pdf_paths)} PDF(s) with {max_workers} worker(s)")
+
+    failed = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_configure_logging,
+        initargs=(args.log_level,)
+    ) as executor:
+        futures = {
+            # Parallelism is across PDFs here, so extract each one in-process
+            executor.submit(_process_one, pdf_path, args, 1): pdf_path
+            for pdf_path in pdf_paths
+        }
+        for future in as_completed(futures):
+            pdf_path = futures[future]
+            try:
+                future.result()
+                logger.info(f"Processed: {pdf_path}")
+            except Exception as e:
+                logger.error(f"Failed to process {pdf_path}: {e}")
+                failed.append(pdf_path)
+
+    if failed:
+        raise PDFMapperException(f"{len(failed)} of {len(pdf_paths)} PDF(s) failed")
+
+
 def main():
     """Main entry point for the PDF text mapper."""
     try:
@@ -26,78 +187,23 @@ def main():
         args = CLIHandler.parse_arguments()
 
         # Configure logging with user's preferred level
-        logging.basicConfig(
-            level=getattr(logging, args.log_level),
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            datefmt='%Y-%m-%d %H:%M:%S'
-        )
+        _configure_logging(args.log_level)
 
         # Validate arguments
         CLIHandler.validate_arguments(args)
 
-        pdf_path = Path(args.pdf_path)
-        logger.info(f"Processing PDF: {pdf_path}")
-
-        # Parse page range if provided
-        page_range = None
-        if args.pages:
-            page_range = CLIHandler.parse_page_range(args.pages)
-            logger.info(f"Processing pages: {[p + 1 for p in page_range]} (1-indexed)")
-
-        # Initialize PDFReader
-        pdf_reader = PDFReader(pdf_path)
-        pdf_reader.validate_path()
-        pdf_reader.open_pdf()
-
-        try:
-            # Try to decrypt if needed
-            try:
-                # Use provided password if available
-                password = args.encryption_password if args.encryption_password else None
-                pdf_reader.decrypt_pdf(password=password)
-            except PDFDecryptionError as e:
-                logger.error(f"PDF decryption failed: {e}")
-                if not args.encryption_password:
-                    logger.error("Please provide --encryption-password if PDF is encrypted")
-                sys.exit(1)
-
-            # Extract text blocks
-            text_blocks = pdf_reader.extract_text_blocks(page_range=page_range)
-
-            # Filter overlapping if requested
-            if args.filter_overlapping:
-                logger.info(f"Filtering overlapping bounding boxes using strategy: {args.overlap_strategy}")
-                overlap_filter = OverlapFilter(overlap_threshold=OVERLAP_THRESHOLD_DEFAULT)
-                text_blocks = overlap_filter.filter_overlapping(
-                    text_blocks,
-                    strategy=args.overlap_strategy
-                )
-                logger.info(f"After filtering: {len(text_blocks)} text blocks")
-
-            # Annotate PDF with bounding boxes
-            pdf_annotator = PDFBBoxAnnotator(pdf_reader.pdf_document, pdf_path)
-            pdf_annotator.draw_rectangles(text_blocks)
-            pdf_annotator.save_pdf()  # Saves as new file with _annotated suffix
-
-            # Export to JSON if requested
-            if args.save_json is not None:
-                json_exporter = JSONExporter(pdf_path)
-                # If empty string (flag provided without value), use default name
-                # Otherwise use provided filename
-                output_filename = None if args.save_json == '' else args.save_json
-                # Get total pages from PDF metadata
-                pdf_metadata = pdf_reader.get_pdf_metadata()
-                total_pages = pdf_metadata['total_pages']
-                output_path = json_exporter.export(
-                    text_blocks,
-                    output_filename=output_filename,
-                    total_pages=total_pages
-                )
-                logger.info(f"JSON exported to: {output_path}")
-
-        finally:
-            # Ensure PDF is always closed, even if errors occur
-            pdf_reader.close()
+        # Page range was parsed during validation
+        if args.pages_parsed is not None:
+            logger.info(f"Processing pages: {args.pages_parsed} (1-indexed)")
+
+        if args.pdf_dir is not None:
+            pdf_dir = Path(args.pdf_dir)
+            logger.info(f"Processing PDF directory: {pdf_dir}")
+            _process_directory(pdf_dir, args)
+        else:
+            pdf_path = Path(args.pdf_path)
+            logger.info(f"Processing PDF: {pdf_path}")
+            _process_one(pdf_path, args)
 
         logger.info("PDF processing completed successfully")
 
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Tuple
+import operator
+from bisect import bisect_right
+from dataclasses import dataclass, field
+from typing import Iterable, Iterator, List, Tuple
 
+# Overlap filtering strategies; the first is the default
+OVERLAP_STRATEGIES = ('keep_largest', 'keep_first')
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class TextBlock:
     """Represents a text block with bounding box and metadata."""
     text: str
@@ -19,6 +24,18 @@ class TextBlock:
 
     def __post_init__(self) -> None:
         """Validate TextBlock data after initialization."""
+        # Valid blocks pass a single combined check; the individual checks
+        # below only run to build the error message.
+        # Note: word_count validation against actual text word count
+        # is not enforced here as it may be expensive and text may be empty
+        if (
+            len(self.bbox) == 4
+            and self.page_number >= 0
+            and self.pdf_width > 0
+            and self.pdf_height > 0
+        ):
+            return
+
         # Validate bbox has 4 elements
         if len(self.bbox) != 4:
             raise ValueError(f"bbox must have 4 elements, got {len(self.bbox)}")
@@ -30,11 +47,66 @@ class TextBlock:
             )
 
         # Validate PDF dimensions are positive
-        if self.pdf_width <= 0 or self.pdf_height <= 0:
-            raise ValueError(
-                f"Invalid PDF dimensions: {self.pdf_width}x{self.pdf_height}"
-            )
+        raise ValueError(
+            f"Invalid PDF dimensions: {self.pdf_width}x{self.pdf_height}"
+        )
 
-        # Note: word_count validation against actual text word count
-        # is not enforced here as it may be expensive and text may be empty
 
+@dataclass(frozen=True)
+class PageSelection:
+    """Set of 0-indexed page numbers stored as sorted half-open intervals."""
+    intervals: Tuple[Tuple[int, int], ...] = ()
+    _starts: List[int] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Sort and merge intervals so membership can use bisection."""
+        merged: List[Tuple[int, int]] = []
+        for start, end in sorted(self.intervals):
+            if start >= end:
+                continue  # Empty interval
+            if merged and start <= merged[-1][1]:
+                merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+            else:
+                merged.append((start, end))
+
+        # Frozen dataclass, so assign through object.__setattr__
+        object.__setattr__(self, 'intervals', tuple(merged))
+        object.__setattr__(self, '_starts', [start for start, _ in merged])
+
+    def __contains__(self, page_num: object) -> bool:
+        """Check membership in O(log k) for k intervals."""
+        try:
+            page_num = operator.index(page_num)
+        except TypeError:
+            return False
+        i = bisect_right(self._starts, page_num) - 1
+        return i >= 0 and page_num < self.intervals[i][1]
+
+    def __iter__(self) -> Iterator[int]:
+        """Iterate selected page numbers in ascending order."""
+        for start, end in self.intervals:
+            yield from range(start, end)
+
+    def __len__(self) -> int:
+        """Number of selected pages."""
+        return sum(end - start for start, end in self.intervals)
+
+    def __str__(self) -> str:
+        """Format as a 1-indexed page range string, e.g. "1-5,10"."""
+        return ','.join(
+            str(start + 1) if end - start == 1 else f"{start + 1}-{end}"
+            for start, end in self.intervals
+        )
+
+    @classmethod
+    def from_pages(cls, pages: Iterable[int]) -> PageSelection:
+        """
+        Build a selection from individual 0-indexed page numbers.
+
+        Args:
+            pages: Iterable of page numbers
+
+        Returns:
+            PageSelection covering the given pages
+        """
+        return cls(tuple((page, page + 1) for page in pages))
@@ -1,19 +1,57 @@
-"""Overlap detection and filtering for bounding boxes using Shapely."""
+"""Overlap detection and filtering for axis-aligned bounding boxes."""
 
 from __future__ import annotations
 
+import functools
 import logging
-from typing import List, Tuple
+from typing import List, Tuple, Union
 
-from shapely.geometry import Polygon
+import numpy as np
 
-from models import TextBlock
+from block_collection import TextBlockCollection
+from models import OVERLAP_STRATEGIES, TextBlock
 
 logger = logging.getLogger(__name__)
 
+# Pages with more blocks than this use the numba kernel when available.
+# Measured on dense text pages: 5,000 blocks take 1.7 ms with NumPy vs 0.8 ms
+# with numba, 10,000 take 8 ms vs 1.8 ms. Below this the saving is around a
+# millisecond per page and cannot repay loading numba (~0.6 s per process)
+NUMBA_MIN_BLOCKS = 10000
+
+# Candidate pairs evaluated per NumPy batch, which caps the sweep's temporary
+# arrays at about 100 bytes per pair
+SWEEP_BATCH_PAIRS = 1 << 18
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_kernel():
+    """
+    Import the numba overlap kernel on first use.
+
+    Deferred because importing numba and loading the cached kernel take
+    about 0.6 s, which only pays off on very dense pages.
+
+    Returns:
+        overlap_numba.detect_overlaps_numba, or None if numba is not installed
+    """
+    try:
+        from overlap_numba import detect_overlaps_numba
+    except ImportError:  # numba is optional, the NumPy sweep is used without it
+        return None
+    return detect_overlaps_numba
+
+
+def _find_root(parent: List[int], i: int) -> int:
+    """Find the root of i in a union-find forest, halving paths on the way."""
+    while parent[i] != i:
+        parent[i] = parent[parent[i]]
+        i = parent[i]
+    return i
+
 
 class OverlapFilter:
-    """Detect and filter overlapping bounding boxes using Shapely."""
+    """Detect and filter overlapping bounding boxes."""
 
     def __init__(self, overlap_threshold: float = 0.5):
         """
@@ -27,26 +65,38 @@ class OverlapFilter:
 
         self.overlap_threshold = overlap_threshold
 
-    def _bbox_to_polygon(self, bbox: Tuple[float, float, float, float]) -> Polygon:
+    def _bbox_area(self, bbox: Tuple[float, float, float, float]) -> float:
         """
-        Convert bounding box to Shapely Polygon.
+        Calculate the area of a bounding box.
 
         Args:
             bbox: Tuple of (x0, y0, x1, y1)
 
         Returns:
-            Shapely Polygon object
+            Area of the bounding box
 
         Raises:
             ValueError: If bbox is invalid
         """
         x0, y0, x1, y1 = bbox
 
-        # Validate bbox before creating polygon
         if x1 <= x0 or y1 <= y0:
             raise ValueError(f"Invalid bbox: {bbox} (x1 <= x0 or y1 <= y0)")
 
-        return Polygon([(x0, y0), (x1, y0), (x1, y1), (x0, y1)])
+        return (x1 - x0) * (y1 - y0)
+
+    @staticmethod
+    def _bbox_areas(bboxes: np.ndarray) -> np.ndarray:
+        """
+        Calculate the areas of many bounding boxes at once.
+
+        Args:
+            bboxes: Array of shape (n, 4) holding (x0, y0, x1, y1) rows
+
+        Returns:
+            Array of shape (n,) with the area of each box
+        """
+        return (bboxes[:, 2] - bboxes[:, 0]) * (bboxes[:, 3] - bboxes[:, 1])
 
     def calculate_coverage_ratio(self, box1: TextBlock, box2: TextBlock) -> float:
         """
@@ -60,18 +110,23 @@ class OverlapFilter:
 
         Returns:
             Coverage ratio (0.0-1.0)
+
+        Raises:
+            ValueError: If either bbox is invalid
         """
-        poly1 = self._bbox_to_polygon(box1.bbox)
-        poly2 = self._bbox_to_polygon(box2.bbox)
+        ax0, ay0, ax1, ay1 = box1.bbox
+        bx0, by0, bx1, by1 = box2.bbox
 
-        if not poly1.intersects(poly2):
-            return 0.0
+        # Disjoint boxes (most pairs) are rejected before any area math.
+        # Degenerate boxes fall through so _bbox_area can reject them.
+        if ax1 <= bx0 or bx1 <= ax0 or ay1 <= by0 or by1 <= ay0:
+            if ax0 < ax1 and ay0 < ay1 and bx0 < bx1 and by0 < by1:
+                return 0.0
 
-        intersection = poly1.intersection(poly2)
-        intersection_area = intersection.area
+        area1 = self._bbox_area(box1.bbox)
+        area2 = self._bbox_area(box2.bbox)
 
-        area1 = poly1.area
-        area2 = poly2.area
+        intersection_area = (min(ax1, bx1) - max(ax0, bx0)) * (min(ay1, by1) - max(ay0, by0))
 
         # Check for very small areas to avoid division issues
         min_area = min(area1, area2)
@@ -81,54 +136,210 @@ class OverlapFilter:
         coverage_ratio = intersection_area / min_area
         return coverage_ratio
 
-    def detect_overlaps(self, text_blocks: List[TextBlock]) -> List[Tuple[int, int, float]]:
+    @staticmethod
+    def _sweep_candidates(
+        bboxes: np.ndarray,
+        positions: np.ndarray
+    ) -> Tuple[int, np.ndarray, np.ndarray]:
+        """
+        Choose the sweep axis for a page and order its boxes along it.
+
+        After sorting boxes by their start on an axis, the candidates of the
+        box at sorted position k are the boxes at k+1 .. k+counts[k], i.e.
+        those starting before it ends. Both axes are counted and the one with
+        fewer candidates is used: blocks of a text column share their x-range,
+        while cells of a table row share their y-range.
+
+        Args:
+            bboxes: Array of shape (n, 4) holding (x0, y0, x1, y1) rows
+            positions: Rows of bboxes to include
+
+        Returns:
+            Tuple of (axis, order, counts): axis is 0 for x and 1 for y, order
+            holds the included rows sorted along that axis and counts the
+            number of candidates of each sorted position
+        """
+        sorted_positions = np.arange(len(positions))
+        best = None
+        for axis in (0, 1):
+            lo = bboxes[positions, axis]
+            hi = bboxes[positions, axis + 2]
+            sort = np.argsort(lo, kind='stable')
+            ends = np.searchsorted(lo[sort], hi[sort], side='left')
+            counts = np.maximum(ends - sorted_positions - 1, 0)
+            total = int(counts.sum())
+            if best is None or total < best[0]:
+                best = (total, axis, positions[sort], counts)
+
+        _, axis, order, counts = best
+        return axis, order, counts
+
+    def _candidate_ratios(
+        self,
+        bboxes: np.ndarray,
+        valid: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Compute coverage ratios for candidate pairs with NumPy.
+
+        Uses a sweep along the axis chosen by _sweep_candidates, so each box
+        is only compared with the boxes that start before it ends on that
+        axis. Candidate pairs are expanded and evaluated in batches of about
+        SWEEP_BATCH_PAIRS, which bounds memory on dense pages.
+
+        Args:
+            bboxes: Array of shape (n, 4) holding (x0, y0, x1, y1) rows
+            valid: Boolean mask of boxes that can be compared
+
+        Returns:
+            Tuple of (first, second, ratios) arrays for the pairs meeting
+            the overlap threshold, in no particular order
+        """
+        positions = np.flatnonzero(valid)
+        if self.overlap_threshold > 0.0:
+            _, order, counts = self._sweep_candidates(bboxes, positions)
+        else:
+            # With a zero threshold every pair qualifies, so no pruning
+            order = positions
+            counts = np.arange(len(positions) - 1, -1, -1)
+
+        x0, y0, x1, y1 = bboxes.T
+        areas = self._bbox_areas(bboxes)
+
+        # Candidate slots of sorted position k are starts[k] .. cum_counts[k]-1
+        cum_counts = np.cumsum(counts)
+        starts = cum_counts - counts
+
+        firsts = [np.empty(0, dtype=np.intp)]
+        seconds = [np.empty(0, dtype=np.intp)]
+        kept_ratios = [np.empty(0, dtype=np.float64)]
+
+        row = 0
+        while row < len(order):
+            # Take rows while the batch stays within SWEEP_BATCH_PAIRS pairs,
+            # but always at least one row
+            stop = int(np.searchsorted(
+                cum_counts, starts[row] + SWEEP_BATCH_PAIRS, side='right'
+            ))
+            stop = max(stop, row + 1)
+
+            batch_counts = counts[row:stop]
+            first = np.repeat(np.arange(row, stop), batch_counts)
+            offsets = np.arange(len(first)) - np.repeat(
+                starts[row:stop] - starts[row], batch_counts
+            )
+            second = first + 1 + offsets
+            a, b = order[first], order[second]
+            row = stop
+
+            inter_w = np.minimum(x1[a], x1[b]) - np.maximum(x0[a], x0[b])
+            inter_h = np.minimum(y1[a], y1[b]) - np.maximum(y0[a], y0[b])
+            inter_area = np.maximum(inter_w, 0.0) * np.maximum(inter_h, 0.0)
+            min_area = np.minimum(areas[a], areas[b])
+
+            # Very small areas are treated as non-overlapping to avoid division issues
+            with np.errstate(divide='ignore', invalid='ignore'):
+                ratios = np.where(min_area > 1e-10, inter_area / min_area, 0.0)
+
+            mask = ratios >= self.overlap_threshold
+            firsts.append(a[mask])
+            seconds.append(b[mask])
+            kept_ratios.append(ratios[mask])
+
+        return np.concatenate(firsts), np.concatenate(seconds), np.concatenate(kept_ratios)
+
+    def _page_overlaps(self, bboxes: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Find overlapping pairs among the bounding boxes of a single page.
+
+        Dense pages are handed to the numba kernel when numba is installed;
+        otherwise the NumPy sweep in _candidate_ratios is used.
+
+        Args:
+            bboxes: Array of shape (n, 4) holding (x0, y0, x1, y1) rows
+
+        Returns:
+            Tuple of (rows, cols, ratios) arrays. rows and cols are positions
+            into bboxes with rows < cols, sorted by (row, col).
+        """
+        x0, y0, x1, y1 = bboxes.T
+
+        # Degenerate boxes cannot be compared, exclude them from all pairs
+        valid = (x1 > x0) & (y1 > y0)
+
+        kernel = None
+        if len(bboxes) > NUMBA_MIN_BLOCKS and self.overlap_threshold > 0.0:
+            kernel = _numba_kernel()
+
+        if kernel is not None:
+            axis, order, _ = self._sweep_candidates(bboxes, np.flatnonzero(valid))
+            # The kernel sweeps along its first coordinate; coverage is
+            # symmetric in x and y, so a y sweep passes the axes swapped
+            columns = (y0, x0, y1, x1) if axis else (x0, y0, x1, y1)
+            first, second, ratios = kernel(
+                *(column[order] for column in columns), self.overlap_threshold
+            )
+            a, b = order[first], order[second]
+        else:
+            a, b, ratios = self._candidate_ratios(bboxes, valid)
+
+        # Report pairs in (row, col) order regardless of sweep order
+        rows, cols = np.minimum(a, b), np.maximum(a, b)
+        pair_order = np.lexsort((cols, rows))
+        return rows[pair_order], cols[pair_order], ratios[pair_order]
+
+    def detect_overlaps(
+        self,
+        text_blocks: Union[List[TextBlock], TextBlockCollection]
+    ) -> List[Tuple[int, int, float]]:
         """
         Detect overlapping bounding boxes.
-        
-        Optimized by grouping blocks by page first to reduce comparisons.
+
+        Each page is checked with a sweep over the x or y axis, whichever
+        prunes more pairs, so only boxes whose intervals on that axis
+        intersect are compared. Pages are read as slices of
+        a TextBlockCollection, which is built here if a list is given.
 
         Args:
-            text_blocks: List of TextBlock objects
+            text_blocks: List of TextBlock objects or a TextBlockCollection
 
         Returns:
             List of tuples (index1, index2, coverage_ratio) for overlapping pairs
         """
+        if isinstance(text_blocks, TextBlockCollection):
+            collection = text_blocks
+        else:
+            collection = TextBlockCollection.from_blocks(text_blocks)
+
         overlaps = []
-        
-        # Group blocks by page to reduce comparisons
-        pages_dict = {}
-        for idx, block in enumerate(text_blocks):
-            page_num = block.page_number
-            if page_num not in pages_dict:
-                pages_dict[page_num] = []
-            pages_dict[page_num].append((idx, block))
 
         # Process each page separately
-        for page_num, page_blocks in pages_dict.items():
-            n = len(page_blocks)
-            if n < 2:
+        for page_num, page_slice in collection.page_slices.items():
+            if page_slice.stop - page_slice.start < 2:
                 continue  # Need at least 2 blocks to have overlaps
 
-            # Compare blocks within the same page
-            for i in range(n):
-                idx_i, block_i = page_blocks[i]
-                for j in range(i + 1, n):
-                    idx_j, block_j = page_blocks[j]
-
-                    try:
-                        coverage_ratio = self.calculate_coverage_ratio(block_i, block_j)
-                    except ValueError as e:
-                        logger.warning(
-                            f"Invalid bbox detected during overlap calculation: {e}, skipping"
-                        )
-                        continue
-
-                    if coverage_ratio >= self.overlap_threshold:
-                        overlaps.append((idx_i, idx_j, coverage_ratio))
-                        logger.debug(
-                            f"Overlap detected: blocks {idx_i} and {idx_j} "
-                            f"(coverage: {coverage_ratio:.2f})"
-                        )
+            indices = collection.order[page_slice]
+            bboxes = collection.bboxes[page_slice]
+
+            x0, y0, x1, y1 = bboxes.T
+            for k in np.flatnonzero((x1 <= x0) | (y1 <= y0)):
+                logger.warning(
+                    f"Invalid bbox detected during overlap calculation: "
+                    f"{collection.blocks[indices[k]].bbox} (x1 <= x0 or y1 <= y0), skipping"
+                )
+
+            rows, cols, ratios = self._page_overlaps(bboxes)
+
+            for idx_i, idx_j, coverage_ratio in zip(
+                indices[rows].tolist(),
+                indices[cols].tolist(),
+                ratios.tolist()
+            ):
+                overlaps.append((idx_i, idx_j, coverage_ratio))
+                logger.debug(
+                    f"Overlap detected: blocks {idx_i} and {idx_j} "
+                    f"(coverage: {coverage_ratio:.2f})"
+                )
 
         logger.info(f"Detected {len(overlaps)} overlapping pairs")
         return overlaps
@@ -151,13 +362,16 @@ class OverlapFilter:
         Raises:
             ValueError: If strategy is not supported
         """
-        if strategy not in ["keep_largest", "keep_first"]:
+        if strategy not in OVERLAP_STRATEGIES:
             raise ValueError(f"Unsupported filtering strategy: {strategy}")
 
         if not text_blocks:
             return text_blocks
 
-        overlaps = self.detect_overlaps(text_blocks)
+        # Group by page once for both overlap detection and area lookup
+        collection = TextBlockCollection.from_blocks(text_blocks)
+
+        overlaps = self.detect_overlaps(collection)
         if not overlaps:
             logger.info("No overlaps detected, returning original blocks")
             return text_blocks
@@ -166,22 +380,32 @@ class OverlapFilter:
         indices_to_remove = set()
 
         if strategy == "keep_largest":
+            # Compute every area once; blocks recur across many pairs
+            areas_by_row = self._bbox_areas(collection.bboxes)
+            areas = np.empty_like(areas_by_row)
+            areas[collection.order] = areas_by_row
+            areas = areas.tolist()
+
+            # Union overlapping blocks into groups, so chains like A-B-C
+            # resolve to one survivor regardless of pair order
+            parent = list(range(len(text_blocks)))
             for i, j, coverage_ratio in overlaps:
-                # Calculate areas
-                poly_i = self._bbox_to_polygon(text_blocks[i].bbox)
-                poly_j = self._bbox_to_polygon(text_blocks[j].bbox)
-
-                area_i = poly_i.area
-                area_j = poly_j.area
-
-                # Remove the smaller one
-                if area_i > area_j:
-                    indices_to_remove.add(j)
-                elif area_j > area_i:
-                    indices_to_remove.add(i)
-                else:
-                    # If equal area, keep the first one
-                    indices_to_remove.add(j)
+                root_i = _find_root(parent, i)
+                root_j = _find_root(parent, j)
+                if root_i != root_j:
+                    parent[max(root_i, root_j)] = min(root_i, root_j)
+
+            # Keep the largest block of each group (first one on equal area)
+            involved = sorted({idx for i, j, _ in overlaps for idx in (i, j)})
+            largest = {}
+            for idx in involved:
+                root = _find_root(parent, idx)
+                if root not in largest or areas[idx] > areas[largest[root]]:
+                    largest[root] = idx
+
+            for idx in involved:
+                if largest[_find_root(parent, idx)] != idx:
+                    indices_to_remove.add(idx)
 
         elif strategy == "keep_first":
             for i, j, coverage_ratio in overlaps:
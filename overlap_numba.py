@@ -0,0 +1,73 @@
+"""Numba kernels for overlap detection (optional dependency)."""
+
+from __future__ import annotations
+
+import numpy as np
+from numba import njit, prange
+
+
+# No fastmath: both passes of the kernel must reach the same decision for
+# every pair, and ratios must match the NumPy path exactly
+@njit(cache=True)
+def _pair_coverage(x0, y0, x1, y1, i, j):
+    """Coverage ratio of boxes i and j (see calculate_coverage_ratio)."""
+    inter_w = min(x1[i], x1[j]) - max(x0[i], x0[j])
+    inter_h = min(y1[i], y1[j]) - max(y0[i], y0[j])
+    if inter_w <= 0.0 or inter_h <= 0.0:
+        return 0.0
+    min_area = min((x1[i] - x0[i]) * (y1[i] - y0[i]),
+                   (x1[j] - x0[j]) * (y1[j] - y0[j]))
+    if min_area <= 1e-10:
+        return 0.0
+    return inter_w * inter_h / min_area
+
+
+@njit(parallel=True, cache=True)
+def detect_overlaps_numba(x0, y0, x1, y1, threshold):
+    """
+    Fused sweep and coverage kernel for boxes sorted by x0.
+
+    The sweep runs along x; pass the columns as (y0, x0, y1, x1) to sweep
+    along y instead, which yields the same ratios.
+
+    All boxes must be valid. Runs two parallel passes over the boxes, one
+    counting the overlaps of each box and one writing them, so only the
+    overlapping pairs are ever stored.
+
+    Returns:
+        Tuple of (first, second, ratios) arrays of positions into the
+        sorted input, with first < second.
+    """
+    n = x0.shape[0]
+    counts = np.zeros(n, dtype=np.int64)
+    for i in prange(n):
+        count = 0
+        j = i + 1
+        while j < n and x0[j] < x1[i]:
+            if _pair_coverage(x0, y0, x1, y1, i, j) >= threshold:
+                count += 1
+            j += 1
+        counts[i] = count
+
+    offsets = np.zeros(n + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum(counts)
+    total = offsets[n]
+    first = np.empty(total, dtype=np.int64)
+    second = np.empty(total, dtype=np.int64)
+    ratios = np.empty(total, dtype=np.float64)
+
+    for i in prange(n):
+        k = offsets[i]
+        end = offsets[i + 1]
+        j = i + 1
+        # Stop at the slots counted for box i; numba does not bounds-check
+        while k < end and j < n and x0[j] < x1[i]:
+            ratio = _pair_coverage(x0, y0, x1, y1, i, j)
+            if ratio >= threshold:
+                first[k] = i
+                second[k] = j
+                ratios[k] = ratio
+                k += 1
+            j += 1
+
+    return first, second, ratios
@@ -1,21 +1,27 @@
-"""PDF bounding box annotation using PyMuPDF."""
+"""PDF bounding box drawing using PyMuPDF."""
 
 from __future__ import annotations
 
 import logging
+from collections import defaultdict
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import TYPE_CHECKING, Any, List, Optional
 
 import fitz  # PyMuPDF
 
 from exceptions import PDFAnnotationError, PDFReadError
 from models import TextBlock
 
+if TYPE_CHECKING:
+    from pdf_reader import PDFReader
+
 logger = logging.getLogger(__name__)
 
 
 class PDFBBoxAnnotator:
-    """Draw bounding box rectangles on PDF pages using PyMuPDF annotations."""
+    """Draw bounding box rectangles on PDF pages using PyMuPDF shapes."""
 
     def __init__(self, pdf_document: fitz.Document, pdf_path: Path):
         """
@@ -32,13 +38,13 @@ class PDFBBoxAnnotator:
         self.pdf_path = Path(pdf_path)
         self.output_path: Optional[Path] = None
 
-    def annotate_page(self, page_num: int, text_blocks: List[TextBlock]) -> None:
+    def annotate_page(self, page_num: int, page_blocks: List[TextBlock]) -> None:
         """
         Annotate a single page with bounding boxes.
 
         Args:
             page_num: Page number (0-indexed)
-            text_blocks: List of TextBlock objects for this page
+            page_blocks: TextBlock objects on this page, already grouped
 
         Raises:
             PDFAnnotationError: If annotation fails
@@ -48,7 +54,11 @@ class PDFBBoxAnnotator:
 
         try:
             page = self.pdf_document[page_num]
-            page_blocks = [block for block in text_blocks if block.page_number == page_num]
+
+            # Collect all rectangles into one shape so the page gets a single
+            # content stream update instead of one annotation per block
+            shape = page.new_shape()
+            drawn = 0
 
             for block in page_blocks:
                 x0, y0, x1, y1 = block.bbox
@@ -60,14 +70,13 @@ class PDFBBoxAnnotator:
                     )
                     continue
 
-                rect = fitz.Rect(x0, y0, x1, y1)
+                shape.draw_rect(fitz.Rect(x0, y0, x1, y1))
+                drawn += 1
 
-                # Add rectangle annotation
-                annot = page.add_rect_annot(rect)
-                # Set annotation properties (black border, transparent fill)
-                annot.set_border(width=1.0)
-                annot.set_colors(stroke=(0, 0, 0))  # Black border
-                annot.update()
+            if drawn:
+                # Black border, transparent fill, drawn on top of page content
+                shape.finish(color=(0, 0, 0), width=1.0, fill=None)
+                shape.commit(overlay=True)
 
             logger.debug(f"Annotated page {page_num} with {len(page_blocks)} bounding boxes")
 
@@ -90,18 +99,17 @@ class PDFBBoxAnnotator:
             logger.warning("No text blocks to annotate")
             return
 
-        # Group text blocks by page
-        pages_dict = {}
+        # Group text blocks by page in a single pass
+        pages_dict = defaultdict(list)
         for block in text_blocks:
-            page_num = block.page_number
-            if page_num not in pages_dict:
-                pages_dict[page_num] = []
-            pages_dict[page_num].append(block)
+            pages_dict[block.page_number].append(block)
 
-        # Annotate each page - pass only relevant blocks for efficiency
-        for page_num in sorted(pages_dict.keys()):
+        # Annotate each page - pages are visited in the order they first
+        # appear, which is page order for extracted blocks; drawing does not
+        # depend on the order anyway
+        for page_num, page_blocks in pages_dict.items():
             try:
-                self.annotate_page(page_num, pages_dict[page_num])
+                self.annotate_page(page_num, page_blocks)
             except Exception as e:
                 if isinstance(e, PDFAnnotationError):
                     raise
@@ -111,10 +119,45 @@ class PDFBBoxAnnotator:
 
         logger.info(f"Drew rectangles on {len(pages_dict)} page(s)")
 
+    def annotate_from_reader(self, pdf_reader: PDFReader, **extract_kwargs: Any) -> None:
+        """
+        Extract text blocks and draw them in a single pass over the pages.
+
+        Blocks arrive from the reader in page order, so each page is drawn as
+        soon as its blocks are extracted and the full block list is never
+        built.
+
+        Args:
+            pdf_reader: PDFReader with the same document opened
+            **extract_kwargs: Passed to PDFReader.iter_text_blocks
+                             (page_range, num_workers)
+
+        Raises:
+            PDFAnnotationError: If drawing fails
+            PDFReadError: If extraction fails
+        """
+        n_pages = 0
+        n_blocks = 0
+        blocks = pdf_reader.iter_text_blocks(**extract_kwargs)
+        for page_num, page_blocks in groupby(blocks, key=attrgetter('page_number')):
+            page_blocks = list(page_blocks)
+            self.annotate_page(page_num, page_blocks)
+            n_pages += 1
+            n_blocks += len(page_blocks)
+
+        if not n_blocks:
+            logger.warning("No text blocks to annotate")
+            return
+
+        logger.info(f"Drew {n_blocks} rectangle(s) on {n_pages} page(s)")
+
     def save_pdf(self, output_path: Optional[Path] = None) -> None:
         """
         Save the modified PDF.
 
+        Unused objects are dropped, duplicate objects merged, content streams
+        cleaned and streams compressed, which keeps the written file small.
+
         Args:
             output_path: Optional output path. If None, creates a new file with
                         "_annotated" suffix in the same directory.
@@ -135,7 +178,13 @@ class PDFBBoxAnnotator:
                     f"Output file {output_path} already exists, will be overwritten"
                 )
 
-            self.pdf_document.save(output_path)
+            self.pdf_document.save(
+                output_path,
+                garbage=4,
+                deflate=True,
+                deflate_images=True,
+                clean=True
+            )
             self.output_path = output_path
             logger.info(f"PDF saved successfully: {output_path}")
 
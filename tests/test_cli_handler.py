@@ -0,0 +1,68 @@
+"""Tests for command-line page range parsing."""
+
+import sys
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from cli_handler import CLIHandler  # noqa: E402
+
+
+class TestParsePageRange(unittest.TestCase):
+    """parse_page_range accepts what the original int()-based parser did."""
+
+    def assert_pages(self, page_str, pages):
+        self.assertEqual(list(CLIHandler.parse_page_range(page_str)), pages)
+
+    def assert_error(self, page_str, message):
+        with self.assertRaises(ValueError) as context:
+            CLIHandler.parse_page_range(page_str)
+        self.assertEqual(str(context.exception), message)
+
+    def test_formats(self):
+        self.assert_pages("1,3,5", [0, 2, 4])
+        self.assert_pages("1-5", [0, 1, 2, 3, 4])
+        self.assert_pages("1,3-5,10", [0, 2, 3, 4, 9])
+        self.assert_pages("", [])
+
+    def test_whitespace(self):
+        self.assert_pages(" 2 - 4 , 7 ", [1, 2, 3, 6])
+        self.assert_pages("\t1,\n2", [0, 1])
+
+    def test_int_literal_forms(self):
+        self.assert_pages("+3", [2])
+        self.assert_pages("3-+4", [2, 3])
+        self.assert_pages("1_0", [9])
+        self.assert_pages("1_0-1_2", [9, 10, 11])
+
+    def test_overlapping_and_adjacent_ranges_merge(self):
+        self.assert_pages("1-3,2-5", [0, 1, 2, 3, 4])
+        self.assert_pages("1-3,4-6", [0, 1, 2, 3, 4, 5])
+        self.assert_pages("5,1-2,2", [0, 1, 4])
+        self.assertEqual(
+            CLIHandler.parse_page_range("1-3,9,4-5").intervals, ((0, 5), (8, 9))
+        )
+
+    def test_str_round_trip(self):
+        for page_str in ("1-5,9", " 2 - 4 , 7 ", "3,1,2", "1_0,+2", "1-3,2-8,20"):
+            selection = CLIHandler.parse_page_range(page_str)
+            self.assertEqual(CLIHandler.parse_page_range(str(selection)), selection)
+        self.assertEqual(str(CLIHandler.parse_page_range("3,1,2,7-9")), "1-3,7-9")
+
+    def test_errors(self):
+        self.assert_error("1,", "Invalid page number: ")
+        self.assert_error("1,,2", "Invalid page number: ")
+        self.assert_error("a", "Invalid page number: a")
+        self.assert_error("++3", "Invalid page number: ++3")
+        self.assert_error("1__0", "Invalid page number: 1__0")
+        self.assert_error("0", "Page numbers must be >= 1: 0")
+        self.assert_error("0-2", "Page numbers must be >= 1: 0-2")
+        self.assert_error("3-1", "Start page must be <= end page: 3-1")
+        self.assert_error("1-a", "Invalid page range format: 1-a")
+        # The original parser reported "Page numbers must be >= 1" here
+        self.assert_error("3--1", "Invalid page range format: 3--1")
+
+
+if __name__ == "__main__":
+    unittest.main()
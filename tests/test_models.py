@@ -0,0 +1,57 @@
+"""Tests for the data models."""
+
+import sys
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import PageSelection  # noqa: E402
+
+
+class TestPageSelection(unittest.TestCase):
+    """PageSelection keeps sorted, merged half-open intervals."""
+
+    def test_overlapping_and_adjacent_intervals_merge(self):
+        selection = PageSelection(((4, 6), (0, 2), (1, 3), (3, 4)))
+        self.assertEqual(selection.intervals, ((0, 6),))
+        self.assertEqual(len(selection), 6)
+
+    def test_disjoint_intervals_stay_separate(self):
+        selection = PageSelection(((8, 9), (0, 2)))
+        self.assertEqual(selection.intervals, ((0, 2), (8, 9)))
+        self.assertEqual(list(selection), [0, 1, 8])
+
+    def test_empty_intervals_are_dropped(self):
+        self.assertEqual(PageSelection(((3, 3), (5, 4))).intervals, ())
+        self.assertEqual(len(PageSelection()), 0)
+
+    def test_from_pages(self):
+        selection = PageSelection.from_pages([5, 1, 2, 2, 9])
+        self.assertEqual(selection.intervals, ((1, 3), (5, 6), (9, 10)))
+
+    def test_contains(self):
+        selection = PageSelection(((0, 2), (5, 6)))
+        self.assertIn(1, selection)
+        self.assertIn(5, selection)
+        self.assertNotIn(2, selection)
+        self.assertNotIn(6, selection)
+        self.assertNotIn(-1, selection)
+
+    def test_contains_accepts_numpy_integers(self):
+        selection = PageSelection(((0, 2), (5, 6)))
+        self.assertIn(np.int64(5), selection)
+        self.assertIn(np.int32(1), selection)
+        self.assertNotIn(np.int64(3), selection)
+        self.assertNotIn(1.0, selection)
+        self.assertNotIn("1", selection)
+
+    def test_str(self):
+        self.assertEqual(str(PageSelection(((0, 5), (8, 9)))), "1-5,9")
+        self.assertEqual(str(PageSelection()), "")
+
+
+if __name__ == "__main__":
+    unittest.main()
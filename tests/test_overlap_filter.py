@@ -0,0 +1,155 @@
+"""Tests for OverlapFilter overlap detection and filtering."""
+
+import itertools
+import random
+import sys
+import unittest
+from pathlib import Path
+from unittest import mock
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from models import TextBlock  # noqa: E402
+from overlap_filter import OverlapFilter, _numba_kernel  # noqa: E402
+
+
+def _block(bbox, page_number=0):
+    """Build a TextBlock with the given bbox on a letter-sized page."""
+    return TextBlock(
+        text="text",
+        bbox=bbox,
+        page_number=page_number,
+        word_count=1,
+        pdf_name="test.pdf",
+        pdf_width=612.0,
+        pdf_height=792.0
+    )
+
+
+def _pairs(first, second, ratios):
+    """Normalize detected pairs to a sorted list of (low, high, ratio)."""
+    return sorted(
+        (min(a, b), max(a, b), r)
+        for a, b, r in zip(first.tolist(), second.tolist(), ratios.tolist())
+    )
+
+
+@unittest.skipIf(_numba_kernel() is None, "numba is not installed")
+class TestNumbaKernelParity(unittest.TestCase):
+    """The numba kernel must report exactly the pairs of the NumPy sweep."""
+
+    def assert_parity(self, bboxes, threshold):
+        overlap_filter = OverlapFilter(overlap_threshold=threshold)
+        valid = (bboxes[:, 2] > bboxes[:, 0]) & (bboxes[:, 3] > bboxes[:, 1])
+        expected = _pairs(*overlap_filter._candidate_ratios(bboxes, valid))
+
+        kernel = _numba_kernel()
+        positions = np.flatnonzero(valid)
+        x0, y0, x1, y1 = bboxes.T
+        # Sweep along x, then along y with the axes swapped
+        for columns, lo in (((x0, y0, x1, y1), x0), ((y0, x0, y1, x1), y0)):
+            order = positions[np.argsort(lo[positions], kind='stable')]
+            first, second, ratios = kernel(
+                *(column[order] for column in columns), threshold
+            )
+            self.assertEqual(
+                _pairs(order[first], order[second], ratios), expected
+            )
+        return expected
+
+    def test_random_boxes(self):
+        rng = random.Random(0)
+        rows = []
+        for _ in range(600):
+            x, y = rng.uniform(0, 500), rng.uniform(0, 700)
+            rows.append((x, y, x + rng.uniform(1, 80), y + rng.uniform(1, 40)))
+        for threshold in (0.1, 0.5, 0.9):
+            self.assert_parity(np.array(rows), threshold)
+
+    def test_borderline_ratios(self):
+        # Boxes on a 0.1 grid produce many ratios at or next to the 0.5
+        # threshold once rounded to binary floats
+        rng = random.Random(1)
+        rows = []
+        for _ in range(800):
+            x, y = rng.randrange(0, 200) / 10, rng.randrange(0, 200) / 10
+            w, h = rng.randrange(1, 40) / 10, rng.randrange(1, 40) / 10
+            rows.append((x, y, x + w, y + h))
+        # Exact half coverage, just above it and just below it
+        rows += [
+            (0.0, 0.0, 2.0, 2.0), (1.0, 0.0, 3.0, 2.0),
+            (10.0, 0.0, 12.0, 2.0), (np.nextafter(11.0, 10.0), 0.0, 13.0, 2.0),
+            (20.0, 0.0, 22.0, 2.0), (np.nextafter(21.0, 22.0), 0.0, 23.0, 2.0),
+        ]
+        # Degenerate boxes are excluded by both paths
+        rows += [(5.0, 5.0, 5.0, 9.0), (5.0, 5.0, 9.0, 5.0)]
+        bboxes = np.array(rows)
+
+        expected = self.assert_parity(bboxes, 0.5)
+        self.assertTrue(any(r == 0.5 for _, _, r in expected))
+
+
+class TestKeepLargest(unittest.TestCase):
+    """keep_largest keeps one block per group of mutually overlapping blocks."""
+
+    def setUp(self):
+        self.overlap_filter = OverlapFilter(overlap_threshold=0.5)
+
+    def test_chain_keeps_only_largest_block(self):
+        # A overlaps B and B overlaps C, but A and C are disjoint. All three
+        # form one group, so A is removed by C although they never overlap.
+        a = _block((0.0, 0.0, 10.0, 10.0))     # area 100
+        b = _block((5.0, 0.0, 20.0, 10.0))     # area 150, covers half of A
+        c = _block((12.0, 0.0, 40.0, 20.0))    # area 560, covers 0.53 of B
+        d = _block((100.0, 100.0, 110.0, 110.0))  # overlaps nothing
+
+        self.assertEqual(self.overlap_filter.calculate_coverage_ratio(a, c), 0.0)
+        result = self.overlap_filter.filter_overlapping([a, b, c, d], "keep_largest")
+        self.assertEqual(result, [c, d])
+
+    def test_equal_area_keeps_first_block(self):
+        first = _block((0.0, 0.0, 10.0, 10.0))
+        second = _block((5.0, 0.0, 15.0, 10.0))  # same area, coverage 0.5
+
+        result = self.overlap_filter.filter_overlapping([first, second], "keep_largest")
+        self.assertEqual(result, [first])
+
+        result = self.overlap_filter.filter_overlapping([second, first], "keep_largest")
+        self.assertEqual(result, [second])
+
+    def test_blocks_on_other_pages_are_independent(self):
+        small = _block((0.0, 0.0, 10.0, 10.0), page_number=0)
+        large = _block((0.0, 0.0, 20.0, 20.0), page_number=1)
+
+        result = self.overlap_filter.filter_overlapping([small, large], "keep_largest")
+        self.assertEqual(result, [small, large])
+
+    def test_result_does_not_depend_on_pair_order(self):
+        blocks = [
+            _block((0.0, 0.0, 10.0, 10.0)),
+            _block((5.0, 0.0, 20.0, 10.0)),
+            _block((12.0, 0.0, 40.0, 20.0)),
+            _block((30.0, 0.0, 45.0, 20.0)),
+            _block((200.0, 0.0, 210.0, 10.0)),
+            _block((205.0, 0.0, 215.0, 10.0)),
+        ]
+        overlaps = self.overlap_filter.detect_overlaps(blocks)
+        self.assertEqual(len(overlaps), 4)
+        expected = self.overlap_filter.filter_overlapping(blocks, "keep_largest")
+        self.assertEqual(expected, [blocks[2], blocks[4]])
+
+        for permutation in itertools.permutations(overlaps):
+            # Pairs may also be reported as (j, i)
+            pairs = [(j, i, r) for i, j, r in permutation]
+            for reported in (list(permutation), pairs):
+                with mock.patch.object(
+                    self.overlap_filter, 'detect_overlaps', return_value=reported
+                ):
+                    result = self.overlap_filter.filter_overlapping(blocks, "keep_largest")
+                self.assertEqual(result, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
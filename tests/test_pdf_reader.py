@@ -0,0 +1,55 @@
+"""Tests for PDFReader text extraction."""
+
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+
+import fitz  # PyMuPDF
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from pdf_reader import PDFReader  # noqa: E402
+
+
+class TestExtractFontlessPages(unittest.TestCase):
+    """Pages without fonts of their own may still carry text in annotations."""
+
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.pdf_path = Path(self.tmp_dir.name) / "annotations.pdf"
+
+        pdf_document = fitz.open()
+        # Page 0: text only in a FreeText annotation
+        page = pdf_document.new_page()
+        page.add_freetext_annot(fitz.Rect(50, 50, 300, 100), "annotation only text")
+        # Page 1: text only in a filled form field
+        page = pdf_document.new_page()
+        widget = fitz.Widget()
+        widget.field_type = fitz.PDF_WIDGET_TYPE_TEXT
+        widget.field_name = "name"
+        widget.field_value = "filled form value"
+        widget.rect = fitz.Rect(50, 50, 300, 80)
+        page.add_widget(widget)
+        # Page 2: blank
+        pdf_document.new_page()
+        pdf_document.save(self.pdf_path)
+        pdf_document.close()
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_annotation_and_widget_text_is_extracted(self):
+        pdf_reader = PDFReader(self.pdf_path)
+        pdf_reader.open_pdf()
+        try:
+            text_blocks = pdf_reader.extract_text_blocks(num_workers=1)
+        finally:
+            pdf_reader.close()
+
+        texts = {block.page_number: block.text for block in text_blocks}
+        self.assertEqual(texts, {0: "annotation only text", 1: "filled form value"})
+
+
+if __name__ == "__main__":
+    unittest.main()